@@ -4,6 +4,7 @@
 Functions to setup a VTK camera to match the OpenCV calibrated camera.
 """
 
+import math
 import vtk
 import numpy as np
 
@@ -17,9 +18,12 @@ def compute_right_camera_pose(left_camera_to_world, left_to_right):
     :param left_to_right: 4x4 numpy ndarray representing rigid transform
     :return: right_camera_to_world as 4x4 numpy ndarray
     """
-    left_world_to_camera = np.linalg.inv(left_camera_to_world)
-    right_world_to_camera = np.matmul(left_to_right, left_world_to_camera)
-    right_camera_to_world = np.linalg.inv(right_world_to_camera)
+    # right_camera_to_world = inv(left_to_right @ inv(left_camera_to_world))
+    #                       = left_camera_to_world @ inv(left_to_right),
+    # so solve X @ left_to_right = left_camera_to_world, rather than
+    # inverting twice.
+    right_camera_to_world = np.linalg.solve(left_to_right.T,
+                                            left_camera_to_world.T).T
     return right_camera_to_world
 
 
@@ -61,16 +65,16 @@ def compute_projection_matrix(width,
     :param far:  far clipping distance in world coordinate frame units (mm)
     :return: vtkMatrix4x4 containing a 4x4 projection matrix
     """
+    # All 16 elements, row-major, copied in with a single call.
+    elements = (
+        2*f_x/width, -2*0/width, (width - 2*c_x)/width, 0,  # No skew, so 0.
+        0, 2*f_y/height, (-height + 2*c_y)/height, 0,
+        0, 0, (-far-near)/(far-near), -2*far*near/(far-near),
+        0, 0, -1, 0
+    )
+
     matrix = vtk.vtkMatrix4x4()
-    matrix.Zero()
-    matrix.SetElement(0, 0, 2*f_x/width)
-    matrix.SetElement(0, 1, -2*0/width)  # Not doing skew, so this will be 0.
-    matrix.SetElement(0, 2, (width - 2*c_x)/width)
-    matrix.SetElement(1, 1, 2*f_y/height)
-    matrix.SetElement(1, 2, (-height + 2*c_y)/height)
-    matrix.SetElement(2, 2, (-far-near)/(far-near))
-    matrix.SetElement(2, 3, -2*far*near/(far-near))
-    matrix.SetElement(3, 2, -1)
+    matrix.DeepCopy(elements)
     return matrix
 
 
@@ -93,19 +97,20 @@ def compute_scissor(window_width,
     :param aspect_ratio: relative physical size of pixels, as x/y.
     :return: scissor_x, scissor_y, scissor_width, scissor_height in pixels
     """
+    scaled_image_height = image_height / aspect_ratio
     width_scale = window_width / image_width
-    height_scale = window_height / (image_height / aspect_ratio)
+    height_scale = window_height / scaled_image_height
 
     vpw = window_width
     vph = window_height
 
     if width_scale < height_scale:
-        vph = int((image_height / aspect_ratio) * width_scale)
+        vph = int(scaled_image_height * width_scale)
     else:
         vpw = int(image_width * height_scale)
 
-    vpx = int((window_width / 2.0) - (vpw / 2.0))
-    vpy = int((window_height / 2.0) - (vph / 2.0))
+    vpx = int((window_width - vpw) / 2.0)
+    vpy = int((window_height - vph) / 2.0)
 
     return vpx, vpy, vpw, vph
 
@@ -164,20 +169,18 @@ def set_camera_pose(vtk_camera, vtk_matrix, opencv_style=True):
     # Start by placing at origin.
     origin = [0, 0, 0, 1]
 
-    # Then work out which way its facing.
+    # Then work out which way its facing. The view up is a direction,
+    # so w=0, and it is only rotated, not translated.
     if opencv_style:
         focal_point = [0, 0, 1000, 1]
-        view_up = [0, -1000, 0, 1]
+        view_up = [0, -1000, 0, 0]
     else:
         focal_point = [0, 0, -1000, 1]
-        view_up = [0, 1000, 0, 1]
+        view_up = [0, 1000, 0, 0]
 
     vtk_matrix.MultiplyPoint(origin, origin)
     vtk_matrix.MultiplyPoint(focal_point, focal_point)
     vtk_matrix.MultiplyPoint(view_up, view_up)
-    view_up[0] = view_up[0] - origin[0]
-    view_up[1] = view_up[1] - origin[1]
-    view_up[2] = view_up[2] - origin[2]
 
     # We then move the camera to that position.
     vtk_camera.SetPosition(origin[0], origin[1], origin[2])
@@ -243,7 +246,7 @@ def set_camera_intrinsics(vtk_renderer,
     vtk_camera.SetWindowCenter(wcx, wcy)
 
     # Set vertical view angle as an indirect way of setting the y focal distance
-    angle = 180 / np.pi * 2.0 * np.arctan2(height / 2.0, f_y)
+    angle = math.degrees(2.0 * math.atan2(height / 2.0, f_y))
     vtk_camera.SetViewAngle(angle)
 
     # But after benoitrosa's method, the aspect/shear is still not right.
@@ -265,10 +268,11 @@ def set_camera_intrinsics(vtk_renderer,
     aspect = vtk_opengl.GetElement(0, 0) / vtk_proj.GetElement(0, 0)
     shear = (aspect * vtk_proj.GetElement(0, 2) - vtk_opengl.GetElement(0, 2)) / (aspect * vtk_proj.GetElement(0, 0))
 
-    # Now set them into the VTK matrices
+    # Now set them into the VTK matrices. The camera already holds
+    # vtk_user_trans, so updating its matrix is enough, but the camera
+    # won't notice the change unless it is marked as modified.
     vtk_user_mat.SetElement(0, 0, aspect)
     vtk_user_trans.SetMatrix(vtk_user_mat)
-    vtk_camera.SetUserTransform(vtk_user_trans)
     vtk_camera.SetViewShear(shear, 0, 0)
     vtk_camera.Modified()
 
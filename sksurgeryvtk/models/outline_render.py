@@ -18,6 +18,8 @@ class VTKOutlineActor(VTKBaseActor):
         """
         super().__init__(colour, visibility=True,
                 opacity=1.0, pickable=pickable)
+        self.silhouette = None
+        self.silhouette_mapper = None
 
     def initialise(self, active_camera, actor):
         """
@@ -30,14 +32,18 @@ class VTKOutlineActor(VTKBaseActor):
         :param actor: the vtk actor we're silhoutting.
 
         """
-        silhouette = vtk.vtkPolyDataSilhouette()
-        silhouette.SetEnableFeatureAngle(False)
+        # Only build the pipeline once. Calling this again, e.g. when
+        # the model is added to another renderer, just re-targets it.
+        if self.silhouette is None:
+            self.silhouette = vtk.vtkPolyDataSilhouette()
+            self.silhouette.SetEnableFeatureAngle(False)
 
-        silhouette.SetCamera(active_camera)
-        silhouette.SetInputData(actor.GetMapper().GetInput())
+            self.silhouette_mapper = vtk.vtkPolyDataMapper()
+            self.silhouette_mapper.SetInputConnection(
+                self.silhouette.GetOutputPort())
 
-        silhouette_mapper = vtk.vtkPolyDataMapper()
-        silhouette_mapper.SetInputConnection(silhouette.GetOutputPort())
+            self.actor.SetMapper(self.silhouette_mapper)
+            self.actor.GetProperty().SetLineWidth(5)
 
-        self.actor.SetMapper(silhouette_mapper)
-        self.actor.GetProperty().SetLineWidth(5)
+        self.silhouette.SetCamera(active_camera)
+        self.silhouette.SetInputData(actor.GetMapper().GetInput())
@@ -60,7 +60,7 @@ class SurfaceModelLoader:
         self.named_surfaces = {}
         self.directory_prefix = directory_prefix
 
-        if 'surfaces' in data.keys():
+        if 'surfaces' in data:
             surfaces = data['surfaces']
         else:
             raise KeyError("No 'surfaces' section defined in config")
@@ -72,61 +72,57 @@ class SurfaceModelLoader:
             surface.set_name(surface_name)
             self.named_surfaces[surface_name] = surface
 
-        if 'assemblies' in data.keys():
+        if 'assemblies' in data:
             assemblies = data['assemblies']
             self.__check_assembly_duplicates(assemblies)
 
             # Iterate over assemblies
             for assembly in assemblies:
-                logging.info("Adding assembly: %s", assembly)
+                # One log line per assembly, rather than one per surface.
+                LOGGER.info("Adding assembly: %s, with surfaces: %s",
+                            assembly, assemblies[assembly])
                 new_assembly = vtk.vtkAssembly()
 
                 # Iterate over surfaces in this assembly
                 for surface_name in assemblies[assembly]:
-                    logging.info("Adding surface: %s to assembly: %s",
-                                 surface_name, assembly)
-
                     # Check surface exists and add to assembly
-                    if surface_name in self.named_surfaces:
-                        surface = self.named_surfaces[surface_name]
-                        new_assembly.AddPart(surface.actor)
-
-                    else:
+                    surface = self.named_surfaces.get(surface_name)
+                    if surface is None:
                         raise KeyError(f"Trying to add {surface_name} to \
                                 vtkAssembly, but it is not a valid surface.")
 
+                    new_assembly.AddPart(surface.actor)
+
                 self.named_assemblies[assembly] = new_assembly
 
     def __load_surface(self, config):
 
-        if 'file' in config.keys():
+        if 'file' in config:
             file_name = config['file']
         else:
             raise KeyError("No 'file' section defined in config")
 
-        if 'opacity' in config.keys():
+        if 'opacity' in config:
             opacity = config['opacity']
         else:
             raise KeyError("No 'opacity' section defined in config")
 
-        if 'visibility' in config.keys():
+        if 'visibility' in config:
             visibility = config['visibility']
         else:
             raise KeyError("No 'visibility' section defined in config")
 
-        if 'colour' in config.keys():
+        if 'colour' in config:
             colour = config['colour']
         else:
             raise KeyError("No 'colour' section defined in config")
 
-        if 'pickable' in config.keys():
+        if 'pickable' in config:
             pickable = config['pickable']
         else:
             raise KeyError("No 'pickable' section defined in config")
 
-        outline = False
-        if 'outline' in config.keys():
-            outline = config['outline']
+        outline = config.get('outline', False)
 
         colour_as_float = [colour[0] / 255.0,
                            colour[1] / 255.0,
@@ -144,13 +140,13 @@ class SurfaceModelLoader:
                                    pickable,
                                    outline)
 
-        if 'texture' in config.keys():
+        if 'texture' in config:
             texture_file = config['texture']
             if self.directory_prefix is not None:
                 texture_file = os.path.join(self.directory_prefix, texture_file)
             model.set_texture(texture_file)
 
-        if 'no shading' in config.keys():
+        if 'no shading' in config:
             no_shading = config['no shading']
             model.set_no_shading(no_shading)
 
@@ -158,19 +154,17 @@ class SurfaceModelLoader:
 
     @staticmethod
     def __check_assembly_duplicates(assemblies):
-        """ Load the model names from all assemblies into a list,
-        then convert it to a set. With no duplicates, the elements
-        in the set should be the same as the elements in the list.
+        """ Check that no model name appears more than once, across
+        all assemblies, stopping at the first duplicate found.
         """
-        all_models = []
-
-        for assembly in assemblies:
-            all_models.extend(assemblies[assembly])
-
-        unique_models = set(all_models)
-
-        if len(all_models) != len(unique_models):
-            raise ValueError("Assemblies do not contain unique elements.")
+        seen_models = set()
+
+        for models in assemblies.values():
+            for model in models:
+                if model in seen_models:
+                    raise ValueError(
+                        "Assemblies do not contain unique elements.")
+                seen_models.add(model)
 
     def get_assembly(self, name):
         """
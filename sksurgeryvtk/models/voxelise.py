@@ -3,12 +3,12 @@ https://gitlab.com/nct_tso_public/Volume2SurfaceCNN
 """
 
 import logging
-import math
 from typing import Union, Tuple
 import os
 import vtk
 from vtk.util import numpy_support
 import numpy as np
+import sksurgeryvtk.utils.matrix_utils as mu
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,26 +30,25 @@ def distanceField(surfaceMesh, targetGrid, targetArrayName: str, signed=False):
     :param signed: Signed/unsigned distance field, defaults to False (unsigned)
     :type signed: bool, optional
     """
-    # Initialize distance field:
-    df = vtk.vtkDoubleArray()
-    df.SetNumberOfTuples(targetGrid.GetNumberOfPoints())
-    df.SetName(targetArrayName)
-
     # Data structure to quickly find cells:
     cellLocator = vtk.vtkCellLocator()
     cellLocator.SetDataSet(surfaceMesh)
     cellLocator.BuildLocator()
-    for i in range(0, targetGrid.GetNumberOfPoints()):
-        # Take a point from the target...
-        testPoint = [0] * 3
-        targetGrid.GetPoint(i, testPoint)
+
+    # Fetch all the target points in one go, and re-use the output
+    # arguments, so the loop only does the locator query.
+    testPoints = numpy_support.vtk_to_numpy(
+        targetGrid.GetPoints().GetData()).tolist()
+    squaredDistances = np.empty(len(testPoints))
+    findClosestPoint = cellLocator.FindClosestPoint
+    cID, subID, dist2 = vtk.mutable(0), vtk.mutable(0), vtk.mutable(0.0)
+    closestPoint = [0.0] * 3
+    for i, testPoint in enumerate(testPoints):
         # ... find the point in the surface closest to it
-        cID, subID, dist2 = vtk.mutable(0), vtk.mutable(0), vtk.mutable(0.0)
-        closestPoint = [0] * 3
-        cellLocator.FindClosestPoint(
-            testPoint, closestPoint, cID, subID, dist2)
-        dist = math.sqrt(dist2)
-        df.SetTuple1(i, dist)
+        findClosestPoint(testPoint, closestPoint, cID, subID, dist2)
+        squaredDistances[i] = dist2.get()
+
+    distances = np.sqrt(squaredDistances)
 
     if signed:
         pts = vtk.vtkPolyData()
@@ -63,10 +62,14 @@ def distanceField(surfaceMesh, targetGrid, targetArrayName: str, signed=False):
         enclosedPointSelector.Update()
         enclosedPoints = enclosedPointSelector.GetOutput()
 
-        for i in range(0, targetGrid.GetNumberOfPoints()):
-            if enclosedPointSelector.IsInside(i):
-                df.SetTuple1(i, -df.GetTuple1(i))     # invert sign
+        # Same test as IsInside(i), applied to every point at once.
+        inside = numpy_support.vtk_to_numpy(
+            enclosedPoints.GetPointData().GetArray("SelectedPoints")) != 0
+        distances[inside] *= -1.0     # invert sign
 
+    # Initialize distance field:
+    df = numpy_support.numpy_to_vtk(distances, deep=1)
+    df.SetName(targetArrayName)
     targetGrid.GetPointData().AddArray(df)
 
 def distanceFieldFromCloud(surfaceCloud, targetGrid, targetArrayName):
@@ -78,35 +81,26 @@ def distanceFieldFromCloud(surfaceCloud, targetGrid, targetArrayName):
     :param targetArrayName: The distance field values will be stored in the \
         target grid, with this array name.
     """
-    # Initialize distance field:
-    df = vtk.vtkDoubleArray()
-    df.SetNumberOfTuples(targetGrid.GetNumberOfPoints())
-    df.SetName(targetArrayName)
-
-    # Data structure to quickly find cells:
+    # Data structure to quickly find points:
     pointLocator = vtk.vtkPointLocator()
     pointLocator.SetDataSet(surfaceCloud)
     pointLocator.BuildLocator()
 
-    for i in range(0, targetGrid.GetNumberOfPoints()):
-        # Take a point from the target...
-        testPoint = [0] * 3
-        targetGrid.GetPoint(i, testPoint)
-        # ... find the point in the surface closest to it
-        cID, subID, dist2 = vtk.mutable(0), vtk.mutable(0), vtk.mutable(0.0)
-        closestPoint = [0] * 3
-
-        closestPointID = pointLocator.FindClosestPoint(testPoint)
-        closestPoint = [0] * 3
-        surfaceCloud.GetPoint(closestPointID, closestPoint)
-        #closestPoint = [0]*3
-        #surfaceMesh.GetPoint( closestPointID, closestPoint )
-        dist = math.sqrt(
-            vtk.vtkMath.Distance2BetweenPoints(
-                testPoint, closestPoint))
-        #dist = math.sqrt(dist2)
-        df.SetTuple1(i, dist)
+    # Only the locator query needs a loop, the distances to the
+    # closest points are then computed all at once.
+    testPoints = numpy_support.vtk_to_numpy(
+        targetGrid.GetPoints().GetData()).astype(np.float64)
+    findClosestPoint = pointLocator.FindClosestPoint
+    closestPointIDs = [findClosestPoint(testPoint)
+                       for testPoint in testPoints.tolist()]
+    closestPoints = numpy_support.vtk_to_numpy(
+        surfaceCloud.GetPoints().GetData())[closestPointIDs]
+    differences = testPoints - closestPoints
+    distances = np.sqrt((differences * differences).sum(axis=1))
 
+    # Initialize distance field:
+    df = numpy_support.numpy_to_vtk(distances, deep=1)
+    df.SetName(targetArrayName)
     targetGrid.GetPointData().AddArray(df)
 
 
@@ -123,33 +117,26 @@ def createGrid(total_size: float, grid_elements: int):
     """
     grid = vtk.vtkStructuredGrid()
     grid.SetDimensions((grid_elements, grid_elements, grid_elements))
-    points = vtk.vtkPoints()
-    points.SetNumberOfPoints(grid_elements**3)
-    pID = 0
     start = -total_size / 2
     d = total_size / (grid_elements - 1)
-    for i in range(0, grid_elements):
-        for j in range(0, grid_elements):
-            for k in range(0, grid_elements):
-                x = start + d * k
-                y = start + d * j
-                z = start + d * i
-                points.SetPoint(pID, x, y, z)
-                pID += 1
+    axis = start + d * np.arange(grid_elements)
+    # x varies fastest, then y, then z, as vtkStructuredGrid expects.
+    zz, yy, xx = np.meshgrid(axis, axis, axis, indexing='ij')
+    coords = np.stack([xx.ravel(), yy.ravel(), zz.ravel()], axis=1)
+    points = vtk.vtkPoints()
+    # vtkPoints defaults to float, so keep that type for the grid.
+    points.SetData(numpy_support.numpy_to_vtk(coords.astype(np.float32),
+                                              deep=1))
     grid.SetPoints(points)
     return grid
 
 
 def storeTransformationMatrix(grid, tf):
     """ Store a transformation matrix inside a vtk grid array."""
-    mat = tf.GetMatrix()
-    matArray = vtk.vtkDoubleArray()
-    matArray.SetNumberOfTuples(16)
-    matArray.SetNumberOfComponents(1)
+    matrix = mu.create_numpy_matrix_from_vtk(tf.GetMatrix())
+    matArray = numpy_support.numpy_to_vtk(matrix.ravel(), deep=1,
+                                          array_type=vtk.VTK_DOUBLE)
     matArray.SetName("TransformationMatrix")
-    for row in range(0, 4):
-        for col in range(0, 4):
-            matArray.SetTuple1(row * 4 + col, mat.GetElement(row, col))
     grid.GetFieldData().AddArray(matArray)
 
 
@@ -274,14 +261,17 @@ def voxelise(input_mesh: Union[np.ndarray, vtk.vtkDataObject, str],
     else:
         input_is_point_cloud = True
 
+        # Build the points and one vertex per point in bulk. vtkPoints
+        # defaults to float, so keep that type for the cloud.
         pts = vtk.vtkPoints()
+        pts.SetData(numpy_support.numpy_to_vtk(
+            np.ascontiguousarray(input_mesh[:, 0:3], dtype=np.float32),
+            deep=1))
+        id_type = numpy_support.get_vtk_to_numpy_typemap()[vtk.VTK_ID_TYPE]
+        ids = np.arange(input_mesh.shape[0] + 1, dtype=id_type)
         verts = vtk.vtkCellArray()
-        for i in range(input_mesh.shape[0]):
-            pts.InsertNextPoint(input_mesh[i][0],
-                                input_mesh[i][1],
-                                input_mesh[i][2])
-
-            verts.InsertNextCell(1, (i,))
+        verts.SetData(numpy_support.numpy_to_vtkIdTypeArray(ids, deep=1),
+                      numpy_support.numpy_to_vtkIdTypeArray(ids[:-1], deep=1))
         mesh = vtk.vtkPolyData()
         mesh.SetPoints(pts)
         mesh.SetVerts(verts)
@@ -535,17 +525,15 @@ def applyTransformation(dataset, tf):
     :param tf: Transform
     :type tf: vtk.vtkTransform
     """
+    linear = mu.create_numpy_matrix_from_vtk(tf.GetMatrix())[0:3, 0:3]
     for i in range(dataset.GetPointData().GetNumberOfArrays()):
         arr = dataset.GetPointData().GetArray(i)
         if arr.GetNumberOfComponents() == 3:
-            for j in range(arr.GetNumberOfTuples()):
-                data = arr.GetTuple3(j)
-                transformed = tf.TransformVector(data)
-                arr.SetTuple3(
-                    j,
-                    transformed[0],
-                    transformed[1],
-                    transformed[2])
+            # Vectors ignore the translation, so only the 3x3 part applies.
+            # vtk_to_numpy returns a view, so this updates arr in place.
+            np_arr = numpy_support.vtk_to_numpy(arr)
+            np_arr[:] = np_arr @ linear.T
+            arr.Modified()
 
 
 def apply_displacement_to_mesh(mesh: Union[vtk.vtkDataObject, str],
@@ -629,30 +617,21 @@ def apply_displacement_to_mesh(mesh: Union[vtk.vtkDataObject, str],
 
     # Actually displace the points in the mesh by adding the displacement
     # to the point coordinates
-    displaced_points = vtk.vtkPoints()
-    for i in range(output.GetNumberOfPoints()):
-        p = output.GetPoint(i)
-        displaced_points.InsertNextPoint(p)
-
     validInternalPoints = output.GetPointData().GetArray("validInternalPoints")
 
     displacement = output.GetPointData().GetArray(disp_array_name)
 
+    np_points = numpy_support.vtk_to_numpy(output.GetPoints().GetData())
+    np_points = np_points.astype(np.float64)
     np_disp = numpy_support.vtk_to_numpy(displacement)
     np_vip = numpy_support.vtk_to_numpy(validInternalPoints)
 
-    for i in range(output.GetNumberOfPoints()):
-        validity = validInternalPoints.GetTuple1(i)
-
-        if validity > 0.5:
+    valid = np_vip > 0.5
+    np_points[valid] += np_disp[valid]
 
-            p = output.GetPoint(i)
-            p = np.asarray(p)
-            d = displacement.GetTuple3(i)
-            d = np.asarray(d)
-            p_d = p + d
-
-            displaced_points.SetPoint(i, p_d[0], p_d[1], p_d[2])
+    displaced_points = vtk.vtkPoints()
+    displaced_points.SetData(
+        numpy_support.numpy_to_vtk(np_points.astype(np.float32), deep=True))
 
     output.SetPoints(displaced_points)
 
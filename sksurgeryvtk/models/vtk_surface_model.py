@@ -6,7 +6,6 @@ essentially as a vtkPolyData.
 """
 
 import os
-import numpy as np
 import vtk
 from vtk.util import numpy_support
 import sksurgerycore.utilities.validate_file as vf
@@ -16,6 +15,24 @@ import sksurgeryvtk.utils.matrix_utils as mu
 # pylint: disable=too-many-instance-attributes
 # pylint:disable=super-with-arguments
 
+# VTK reader class for each file extension that VTKSurfaceModel can read.
+_READERS = {
+    '.vtk': vtk.vtkPolyDataReader,
+    '.stl': vtk.vtkSTLReader,
+    '.ply': vtk.vtkPLYReader,
+    '.vtp': vtk.vtkXMLPolyDataReader,
+}
+
+# File extensions that VTKSurfaceModel can read.
+SUPPORTED_FILE_EXTENSIONS = tuple(_READERS)
+
+# VTK reader class for each image file extension usable as a texture.
+_TEXTURE_READERS = {
+    '.png': vtk.vtkPNGReader,
+    '.jpeg': vtk.vtkJPEGReader,
+    '.jpg': vtk.vtkJPEGReader,
+}
+
 
 class VTKSurfaceModel(vbm.VTKBaseModel):
     """
@@ -45,26 +62,16 @@ class VTKSurfaceModel(vbm.VTKBaseModel):
         self.texture_reader = None
         self.texture = None
 
-        # Works like FactoryMethod. Could be refactored elsewhere.
         if filename is not None:
 
             vf.validate_is_file(filename)
 
-            if filename.endswith('.vtk'):
-                self.reader = vtk.vtkPolyDataReader()
-
-            elif filename.endswith('.stl'):
-                self.reader = vtk.vtkSTLReader()
-
-            elif filename.endswith('.ply'):
-                self.reader = vtk.vtkPLYReader()
-
-            elif filename.endswith('.vtp'):
-                self.reader = vtk.vtkXMLPolyDataReader()
-            else:
+            extension = os.path.splitext(filename)[1].lower()
+            reader_class = _READERS.get(extension)
+            if reader_class is None:
                 raise ValueError(
                     f'File type not supported for model loading: {filename}')
-
+            self.reader = reader_class()
             self.reader.SetFileName(filename)
             self.reader.Update()
             self.source = self.reader.GetOutput()
@@ -214,16 +221,12 @@ class VTKSurfaceModel(vbm.VTKBaseModel):
 
             vf.validate_is_file(filename)
 
-            if filename.endswith('.png'):
-                self.texture_reader = vtk.vtkPNGReader()
-
-            elif np.logical_or(filename.endswith('.jpeg'),
-                               filename.endswith('.jpg')):
-                self.texture_reader = vtk.vtkJPEGReader()
-
-            else:
+            extension = os.path.splitext(filename)[1].lower()
+            reader_class = _TEXTURE_READERS.get(extension)
+            if reader_class is None:
                 raise ValueError(
                     f'File type not supported for texture loading: {filename}')
+            self.texture_reader = reader_class()
 
         else:
             # Unset texture when the function is called with None.
@@ -13,6 +13,12 @@ import sksurgeryvtk.models.vtk_surface_model as sm
 
 LOGGER = logging.getLogger(__name__)
 
+# Colours used, in order, when a model has no colour specified.
+DEFAULT_COLOURS = [colors.red, colors.blue, colors.green,
+                   colors.black, colors.white, colors.yellow,
+                   colors.brown, colors.grey, colors.purple,
+                   colors.pink]
+
 
 class VTKSurfaceModelDirectoryLoader:
     """
@@ -62,8 +68,10 @@ class VTKSurfaceModelDirectoryLoader:
 
         self.defaults_file = defaults_file
         if self.defaults_file:
+            # The manager is discarded straight away and the defaults are
+            # only ever read, so there's no need for get_copy()'s deepcopy.
             configuration_manager = cm.ConfigurationManager(self.defaults_file)
-            self.configuration_data = configuration_manager.get_copy()
+            self.configuration_data = configuration_manager.config_data
 
         self.colours = None
         if directory_name:
@@ -83,13 +91,16 @@ class VTKSurfaceModelDirectoryLoader:
         LOGGER.info("Loading models from %s", directory_name)
 
         # Reset
-        files = []
         self.models = []
 
         # This may well throw FileNotFoundError which is fine.
         # If its not valid I want the Exception raised.
-        files = os.listdir(directory_name)
-        files.sort()
+        # Only files with a supported extension are worth trying to load.
+        with os.scandir(directory_name) as entries:
+            files = sorted(
+                entry.name for entry in entries
+                if entry.is_file()
+                and entry.name.lower().endswith(sm.SUPPORTED_FILE_EXTENSIONS))
 
         # Loop through each file, trying to load it.
         counter = 0
@@ -145,13 +156,15 @@ class VTKSurfaceModelDirectoryLoader:
                 else:
                     # Original behaviour (see previous version in git)
                     # Either load colour from file, or we just pick a
-                    # colour based on an index.
+                    # colour based on an index, cycling through the
+                    # defaults if there are more models than colours.
                     if filename in self.colours:
                         model_colour = self.colours[filename]
                     else:
                         LOGGER.info(
                             "Filename %s not found in colours.txt", filename)
-                        model_colour = self.colours[str(counter)]
+                        model_colour = DEFAULT_COLOURS[
+                            counter % len(DEFAULT_COLOURS)]
                     model.set_colour(model_colour)
 
                 # Finally, add to list, increment counter.
@@ -171,17 +184,10 @@ class VTKSurfaceModelDirectoryLoader:
     def get_model_colours(self, directory):
         """
         Load colours for each model from a .txt file in the model
-        directory.
+        directory. Models not listed get one of DEFAULT_COLOURS.
         """
-        # pylint: disable=consider-using-enumerate
-
         self.colours = {}
 
-        default_colours = [colors.red, colors.blue, colors.green,
-                           colors.black, colors.white, colors.yellow,
-                           colors.brown, colors.grey, colors.purple,
-                           colors.pink]
-
         colour_file = directory + '/colours.txt'
 
         if os.path.exists(colour_file):
@@ -204,6 +210,3 @@ class VTKSurfaceModelDirectoryLoader:
                     self.colours[filename] = (float(row[1]),
                                               float(row[2]),
                                               float(row[3]))
-        else:
-            for i in range(len(default_colours)):
-                self.colours[str(i)] = default_colours[i]
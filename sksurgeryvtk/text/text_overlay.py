@@ -218,6 +218,7 @@ class VTKText(VTKTextBase):
         """
 
         width, height = self.parent_window.GetRenderWindow().GetSize()
+        self.window_size = (width, height)
 
         middle_x = width // 2
         middle_y = height // 2
@@ -233,6 +234,12 @@ class VTKText(VTKTextBase):
         """
         width, height = self.parent_window.GetRenderWindow().GetSize()
 
+        # ModifiedEvent fires far more often than the window is resized,
+        # so only reposition when the size has actually changed.
+        if (width, height) == self.window_size:
+            return
+        self.window_size = (width, height)
+
         middle_x = width // 2
         middle_y = height // 2
 
@@ -286,6 +293,7 @@ class VTKLargeTextCentreOfScreen(VTKTextBase):
         """
 
         self.parent_window = parent_window
+        self.window_size = None
         self.parent_window.AddObserver('ModifiedEvent',
                                        self.calculate_text_size)
         self.calculate_text_size(None, None)
@@ -300,5 +308,10 @@ class VTKLargeTextCentreOfScreen(VTKTextBase):
 
         width, height = self.parent_window.GetRenderWindow().GetSize()
 
+        # Only resize the text if the window size has actually changed.
+        if (width, height) == self.window_size:
+            return
+        self.window_size = (width, height)
+
         self.set_text_position(width/2, height/2)
         self.text_actor.SetMinimumSize(width, height)
@@ -30,11 +30,8 @@ def create_numpy_matrix_from_vtk(matrix):
     """
     validate_vtk_matrix_4x4(matrix)
 
-    transformation = np.eye(4)
-    for i in range(4):
-        for j in range(4):
-            transformation[i, j] = matrix.GetElement(i, j)
-    return transformation
+    # GetData() returns all 16 elements in row-major order, in one call.
+    return np.array(matrix.GetData()).reshape(4, 4)
 
 
 def validate_vtk_matrix_4x4(matrix):
@@ -4,6 +4,7 @@
 Any useful little utilities to do with projecting 3D to 2D.
 """
 
+import math
 import cv2
 import vtk
 import numpy as np
@@ -69,11 +70,11 @@ def project_points(points,
                                    camera_matrix,
                                    distortion)
 
-    world_to_camera = np.linalg.inv(camera_to_world)
-
-    t_vec = np.zeros((3, 1))
-    t_vec[0:3, :] = world_to_camera[0:3, 3:4]
-    r_vec, _ = cv2.Rodrigues(world_to_camera[0:3, 0:3])
+    # camera_to_world was validated as rigid, so its inverse is simply
+    # [R^T | -R^T t], without needing a general matrix inversion.
+    rotation = np.ascontiguousarray(camera_to_world[0:3, 0:3].T)
+    t_vec = -rotation @ camera_to_world[0:3, 3:4]
+    r_vec, _ = cv2.Rodrigues(rotation)
 
     projected, _ = cv2.projectPoints(points,
                                      r_vec,
@@ -163,20 +164,28 @@ def compute_rms_error(model_points,
     :param scale_x: scale factor for x
     :param scale_y: scale factor for y
     :param image_height: image height
+    :raises: ValueError if model_points and image_points differ in length
     """
+    if len(model_points) != len(image_points):
+        raise ValueError("model_points and image_points should have "
+                         "the same number of points.")
+
     coord_3d = vtk.vtkCoordinate()
     coord_3d.SetCoordinateSystemToWorld()
     counter = 0
     rms = 0
 
-    for m_c in model_points:
+    # Bind the VTK methods once, as they are called for every point.
+    set_value = coord_3d.SetValue
+    get_display_value = coord_3d.GetComputedDoubleDisplayValue
+
+    for m_c, i_c in zip(model_points, image_points):
 
-        coord_3d.SetValue(float(m_c[0]), float(m_c[1]), float(m_c[2]))
-        i_c = image_points[counter]
+        set_value(float(m_c[0]), float(m_c[1]), float(m_c[2]))
 
         # This will scale to the vtkRenderWindow, which may
         # well be a different size to the original image.
-        p_x, p_y = coord_3d.GetComputedDoubleDisplayValue(renderer)
+        p_x, p_y = get_display_value(renderer)
 
         # Scale them up to the right image size.
         p_x *= scale_x
@@ -194,6 +203,6 @@ def compute_rms_error(model_points,
         counter += 1
 
     rms /= float(counter)
-    rms = np.sqrt(rms)
+    rms = math.sqrt(rms)
 
     return rms
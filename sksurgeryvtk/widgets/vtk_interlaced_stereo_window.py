@@ -188,8 +188,14 @@ class VTKStereoInterlacedWindow(QtWidgets.QWidget):
         left = self.left_widget.convert_scene_to_numpy_array()
         right = self.right_widget.convert_scene_to_numpy_array()
 
-        self.left_rescaled = cv2.resize(left, (0, 0), fx=1, fy=0.5)
-        self.right_rescaled = cv2.resize(right, (0, 0), fx=1, fy=0.5)
+        # Pass the previous buffers as dst, so OpenCV writes into them
+        # in place, and only allocates if the window size has changed.
+        self.left_rescaled = cv2.resize(left, (0, 0),
+                                        dst=self.left_rescaled,
+                                        fx=1, fy=0.5)
+        self.right_rescaled = cv2.resize(right, (0, 0),
+                                         dst=self.right_rescaled,
+                                         fx=1, fy=0.5)
 
     def __update_interlaced(self):
         """
@@ -39,6 +39,20 @@ import sksurgeryvtk.utils.matrix_utils as mu
 
 LOGGER = logging.getLogger(__name__)
 
+# vtkCamera properties saved by get_camera_state, to restore the view.
+CAMERA_PROPERTIES_TO_SAVE = (
+    "Position",
+    "FocalPoint",
+    "ViewUp",
+    "ViewAngle",
+    "ParallelProjection",
+    "ParallelScale",
+    "ClippingRange",
+    "EyeAngle",
+    "EyeSeparation",
+    "UseOffAxisProjection",
+)
+
 
 class VTKOverlayWindow(QVTKRenderWindowInteractor):
     """
@@ -78,6 +92,10 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
         as part of the init function. Set to false if you're on Linux.
     :param video_in_layer_0: If true, will add video to Layer 0, fully opaque, no masking.
     :param video_in_layer_2: If true, will add video to Layer 1. If layer_2_video_mask is present, will mask alpha channel.
+    :param max_number_of_peels: If use_depth_peeling, the maximum number of depth peeling passes per frame.
+        Fewer peels is faster, at the cost of accuracy where many translucent surfaces overlap.
+    :param interactor_style: vtkInteractorStyle to use. If None, uses vtkInteractorStyleTrackballCamera.
+        For windows whose camera is driven programmatically, pass a cheaper style, e.g. vtkInteractorStyleUser.
     """
 
     def __init__(
@@ -95,7 +113,9 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
         layer_2_video_mask=None,  # For masking in Layer 3
         use_depth_peeling=True,  # Historically, has defaulted to true.
         layer_1_interactive=True, # For backwards compatibility, prior to 3rd Feb 2024.
-        layer_3_interactive=False # For backwards compatibility, prior to 3rd Feb 2024.
+        layer_3_interactive=False, # For backwards compatibility, prior to 3rd Feb 2024.
+        max_number_of_peels=100,  # Historically, was fixed at 100.
+        interactor_style=None  # For backwards compatibility, defaults to trackball camera.
     ):
         """
         Constructs a new VTKOverlayWindow.
@@ -130,6 +150,8 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
         self.output_halved = None
         self.vtk_image = None
         self.vtk_array = None
+        self.vtk_win_to_img_filter = None
+        self.vtk_scale = None
         self.interactor = None
 
         # Setup an image importer to import the RGB video image.
@@ -218,17 +240,18 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
             self.GetRenderWindow().AlphaBitPlanesOn()
             self.GetRenderWindow().SetMultiSamples(0)
             self.layer_1_renderer.UseDepthPeelingOn()
-            self.layer_1_renderer.SetMaximumNumberOfPeels(100)
+            self.layer_1_renderer.SetMaximumNumberOfPeels(max_number_of_peels)
             self.layer_1_renderer.SetOcclusionRatio(0.1)
             self.layer_3_renderer.UseDepthPeelingOn()
-            self.layer_3_renderer.SetMaximumNumberOfPeels(100)
+            self.layer_3_renderer.SetMaximumNumberOfPeels(max_number_of_peels)
             self.layer_3_renderer.SetOcclusionRatio(0.1)
 
         # Use this to ensure the video is setup correctly at construction.
         self.set_video_image(self.rgb_input)
 
         # Setup the general interactor style. See VTK docs for alternatives.
-        self.interactor = vtk.vtkInteractorStyleTrackballCamera()
+        self.interactor = interactor_style if interactor_style is not None \
+            else vtk.vtkInteractorStyleTrackballCamera()
         self.SetInteractorStyle(self.interactor)
 
         # Hook VTK world up to window
@@ -290,7 +313,8 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
         See also constructor args video_in_layer_0 and video_in_layer_2 which controls
         in which layer(s) the video image ends up.
 
-        :param input_image: We use OpenCV, so the input image, should be BGR channel order.
+        :param input_image: We use OpenCV, so the input image, should be BGR channel order,
+            and 8 bit, i.e. np.uint8.
         """
         if not isinstance(input_image, np.ndarray):
             raise TypeError("Input is not an np.ndarray")
@@ -300,6 +324,8 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
             )
         if input_image.shape[2] != 3:
             raise ValueError("Input image should be 3 channel, i.e. BGR.")
+        if input_image.dtype != np.uint8:
+            raise ValueError("Input image should be 8 bit, i.e. np.uint8.")
 
         # Note: We will assume that any video comming in is 3 channel, BGR.
         # But layer 2 will use RGBA as we need the alpha channel.
@@ -340,29 +366,38 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
 
         if self.video_in_layer_0:
             self.rgb_input = input_image
-            self.rgb_frame = np.copy(self.rgb_input[:, :, ::-1])
-            self.rgb_image_importer.SetImportVoidPointer(self.rgb_frame.data)
-            self.rgb_image_importer.SetDataExtent(self.rgb_image_extent)
-            self.rgb_image_importer.SetWholeExtent(self.rgb_image_extent)
+            # Re-use the buffer VTK is importing from, while the size
+            # is unchanged, rather than allocating a new frame each time.
+            # VTK only needs pointing at the buffer when it is reallocated.
+            if (
+                self.rgb_frame is None
+                or self.rgb_frame.shape != input_image.shape
+            ):
+                # vtkImageImport reads a C-ordered buffer, so don't use
+                # np.empty_like, which would copy the input's memory layout.
+                self.rgb_frame = np.empty(
+                    input_image.shape, dtype=np.uint8, order="C"
+                )
+                self.rgb_image_importer.SetImportVoidPointer(self.rgb_frame.data)
+            cv2.cvtColor(self.rgb_input, cv2.COLOR_BGR2RGB, dst=self.rgb_frame)
             self.rgb_image_importer.Modified()
             self.rgb_image_importer.Update()
 
         if self.video_in_layer_2:
             self.rgb_input = input_image
-            self.rgba_frame = 255 * np.ones(
-                (
-                    input_image.shape[0],
-                    input_image.shape[1],
-                    input_image.shape[2] + 1,
-                ),
-                dtype=np.uint8,
+            # As above, only allocate a new buffer if the size changes.
+            # The conversion sets the alpha channel opaque, before masking.
+            rgba_shape = (
+                input_image.shape[0],
+                input_image.shape[1],
+                input_image.shape[2] + 1,
             )
-            self.rgba_frame[:, :, 0:3] = self.rgb_input[:, :, ::-1]
+            if self.rgba_frame is None or self.rgba_frame.shape != rgba_shape:
+                self.rgba_frame = np.empty(rgba_shape, dtype=np.uint8)
+                self.rgba_image_importer.SetImportVoidPointer(self.rgba_frame.data)
+            cv2.cvtColor(self.rgb_input, cv2.COLOR_BGR2RGBA, dst=self.rgba_frame)
             if self.mask_image is not None:
                 self.rgba_frame[:, :, 3:4] = self.mask_image
-            self.rgba_image_importer.SetImportVoidPointer(self.rgba_frame.data)
-            self.rgba_image_importer.SetDataExtent(self.rgba_image_extent)
-            self.rgba_image_importer.SetWholeExtent(self.rgba_image_extent)
             self.rgba_image_importer.Modified()
             self.rgba_image_importer.Update()
 
@@ -664,32 +699,52 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
 
         :return output: Scene as numpy array
         """
-        vtk_win_to_img_filter = vtk.vtkWindowToImageFilter()
-        vtk_win_to_img_filter.SetInput(self.GetRenderWindow())
+        np_array = self.__grab_scene()
+        self.output = cv2.flip(np_array, flipCode=0)
+        return self.output
+
+    def __grab_scene(self):
+        """
+        Reads the current window view, returning a numpy view of
+        the VTK image, which is upside down compared to OpenCV.
+        """
+        # Create the export pipeline once, and re-use it on each call.
+        if self.vtk_win_to_img_filter is None:
+            self.vtk_win_to_img_filter = vtk.vtkWindowToImageFilter()
+            self.vtk_win_to_img_filter.SetInput(self.GetRenderWindow())
+            # The filter re-renders before reading, so read the freshly
+            # rendered back buffer, rather than the front buffer.
+            self.vtk_win_to_img_filter.ReadFrontBufferOff()
+
+            if not self.zbuffer:
+                self.vtk_win_to_img_filter.SetInputBufferTypeToRGB()
+            else:
+                self.vtk_win_to_img_filter.SetInputBufferTypeToZBuffer()
+                self.vtk_scale = vtk.vtkImageShiftScale()
+                self.vtk_scale.SetInputConnection(
+                    self.vtk_win_to_img_filter.GetOutputPort()
+                )
+                self.vtk_scale.SetOutputScalarTypeToUnsignedChar()
+                self.vtk_scale.SetShift(0)
+                self.vtk_scale.SetScale(-255)
+
+        # The filter won't re-read the window unless it is marked as modified.
+        self.vtk_win_to_img_filter.Modified()
 
         if not self.zbuffer:
-            vtk_win_to_img_filter.SetInputBufferTypeToRGB()
-            vtk_win_to_img_filter.Update()
-            self.vtk_image = vtk_win_to_img_filter.GetOutput()
+            self.vtk_win_to_img_filter.Update()
+            self.vtk_image = self.vtk_win_to_img_filter.GetOutput()
         else:
-            vtk_win_to_img_filter.SetInputBufferTypeToZBuffer()
-            vtk_scale = vtk.vtkImageShiftScale()
-            vtk_scale.SetInputConnection(vtk_win_to_img_filter.GetOutputPort())
-            vtk_scale.SetOutputScalarTypeToUnsignedChar()
-            vtk_scale.SetShift(0)
-            vtk_scale.SetScale(-255)
-            vtk_scale.Update()
-            self.vtk_image = vtk_scale.GetOutput()
+            self.vtk_scale.Update()
+            self.vtk_image = self.vtk_scale.GetOutput()
 
         width, height, _ = self.vtk_image.GetDimensions()
         self.vtk_array = self.vtk_image.GetPointData().GetScalars()
-        number_of_components = self.vtk_array.GetNumberOfComponents()
+        number_of_components = 1 if self.zbuffer else 3
 
-        np_array = vtk_to_numpy(self.vtk_array).reshape(
+        return vtk_to_numpy(self.vtk_array).reshape(
             height, width, number_of_components
         )
-        self.output = cv2.flip(np_array, flipCode=0)
-        return self.output
 
     def save_scene_to_file(self, file_name):
         """
@@ -698,8 +753,9 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
         space before saving to file.
         :param file_name: must be compatible with cv2.imwrite()
         """
-        self.convert_scene_to_numpy_array()
-        self.output = cv2.cvtColor(self.output, cv2.COLOR_RGB2BGR)
+        np_array = self.__grab_scene()
+        # Flip vertically and swap RGB to BGR in a single copy.
+        self.output = np.ascontiguousarray(np_array[::-1, :, ::-1])
         cv2.imwrite(file_name, self.output)
 
     def get_camera_state(self, layer=1):
@@ -708,48 +764,27 @@ class VTKOverlayWindow(QVTKRenderWindowInteractor):
         view to be restored. For legacy compatibility,
         this will assume layer 1, like this class was pre-Feb 3rd 2024.
         """
-        # pylint: disable=unused-variable, eval-used
-
         renderer = self.get_foreground_renderer(layer)
         camera = renderer.GetActiveCamera()
-        camera_properties = {}
-
-        properties_to_save = [
-            "Position",
-            "FocalPoint",
-            "ViewUp",
-            "ViewAngle",
-            "ParallelProjection",
-            "ParallelScale",
-            "ClippingRange",
-            "EyeAngle",
-            "EyeSeparation",
-            "UseOffAxisProjection",
-        ]
-
-        for camera_property in properties_to_save:
-            # eval will run commands of the form
-            # 'camera.GetPosition()', 'camera.GetFocalPoint()' for each property
-
-            property_value = eval("camera.Get" + camera_property + "()")
-            camera_properties[camera_property] = property_value
-
-        return camera_properties
+
+        # Calls 'camera.GetPosition()', 'camera.GetFocalPoint()' etc.
+        return {
+            camera_property: getattr(camera, "Get" + camera_property)()
+            for camera_property in CAMERA_PROPERTIES_TO_SAVE
+        }
 
     def set_camera_state(self, camera_properties, layer=1):
         """
         Set the camera properties to a particular view poisition/angle etc. For legacy compatibility,
         this will assume layer 1, like this class was pre-Feb 3rd 2024.
         """
-        # pylint: disable=unused-variable, eval-used
-
         renderer = self.get_foreground_renderer(layer)
         camera = renderer.GetActiveCamera()
 
         for camera_property, value in camera_properties.items():
-            # eval statements 'camera.SetPosition(position)',
-            # 'camera.SetFocalPoint(focalpoint) etc.
-            eval("camera.Set" + camera_property + "(" + str(value) + ")")
+            # Calls 'camera.SetPosition(position)',
+            # 'camera.SetFocalPoint(focalpoint)' etc.
+            getattr(camera, "Set" + camera_property)(value)
 
     def remove_view_props_from_renderer(self, layer: int):
         """
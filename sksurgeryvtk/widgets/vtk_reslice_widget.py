@@ -2,23 +2,33 @@
 Module to show slice views of volumetric data.
 """
 #pylint:disable=too-many-instance-attributes, no-name-in-module
+import logging
 import os
+import threading
+import time
+import warnings
 import vtk
 import numpy as np
 from PySide6 import QtWidgets
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Signal
 
 from vtkmodules.qt.QVTKRenderWindowInteractor \
         import QVTKRenderWindowInteractor
 
+LOGGER = logging.getLogger(__name__)
+
 
 class VTKResliceWidget(QVTKRenderWindowInteractor):
     """ Widget to show a single slice of Volumetric Data.
     :param reader: vtkReader class e.g. DICOM/Niftii/gipl
     :param axis: x/y/z axis selection
     :param parent: parent QWidget.
+    :param number_of_threads: number of threads used by the VTK imaging
+        filters. Defaults to 1, as multi-threaded image filters can
+        contend with some OpenGL drivers' own render threads and slow
+        down slice browsing. Pass None to keep VTK's default.
     """
-    def __init__(self, reader, axis, parent):
+    def __init__(self, reader, axis, parent, number_of_threads=1):
 
         if axis not in ['x', 'y', 'z']:
             raise TypeError('Argument should be x/y/z')
@@ -27,6 +37,8 @@ class VTKResliceWidget(QVTKRenderWindowInteractor):
         self.axis = axis
         self.position = 0
         self.reader = reader
+        self.number_of_threads = number_of_threads
+        self.on_slice_changed = None
 
          # Calculate the center of the volume
         self.x_min, self.x_max, self.y_min, self.y_max, self.z_min, self.z_max \
@@ -84,6 +96,8 @@ class VTKResliceWidget(QVTKRenderWindowInteractor):
         self.colours = vtk.vtkImageMapToColors()
         self.colours.SetInputConnection(self.reader.GetOutputPort())
         self.colours.SetLookupTable(self.lut)
+        if self.number_of_threads is not None:
+            self.colours.SetNumberOfThreads(self.number_of_threads)
         self.colours.Update()
 
         self.actor.GetMapper().SetInputConnection(self.colours.GetOutputPort())
@@ -145,15 +159,23 @@ class VTKResliceWidget(QVTKRenderWindowInteractor):
         """ Callback to change slice position using mouse wheel. """
         current_position = self.get_slice_position()
         self.set_slice_position_pixels(current_position + 1)
+        if self.on_slice_changed is not None:
+            self.on_slice_changed()
 
     def on_mouse_wheel_backward(self, obj, event):
         #pylint:disable=unused-argument
         """ Callback to change slice position using mouse wheel. """
         current_position = self.get_slice_position()
         self.set_slice_position_pixels(current_position - 1)
+        if self.on_slice_changed is not None:
+            self.on_slice_changed()
+
+    def set_mouse_wheel_callbacks(self, on_slice_changed=None):
+        """ Add callbacks for scroll events.
 
-    def set_mouse_wheel_callbacks(self):
-        """ Add callbacks for scroll events. """
+        :param on_slice_changed: optional function, called with no
+            arguments after the mouse wheel has moved the slice. """
+        self.on_slice_changed = on_slice_changed
         self._Iren.AddObserver('MouseWheelForwardEvent',
                                self.on_mouse_wheel_forward)
 
@@ -163,9 +185,11 @@ class VTKResliceWidget(QVTKRenderWindowInteractor):
 
 class VTKSliceViewer(QtWidgets.QWidget):
     """ Othrogonal slice viewer showing Axial/Sagittal/Coronal views
-    :param input_data: path to volume data """
+    :param input_data: path to volume data
+    :param number_of_threads: number of threads used by each slice
+        view's VTK imaging filters, see VTKResliceWidget. """
 
-    def __init__(self, input_data):
+    def __init__(self, input_data, number_of_threads=1):
 
         super().__init__()
 
@@ -189,9 +213,12 @@ class VTKSliceViewer(QtWidgets.QWidget):
         self.fourth_panel_renderer.SetBackground(.1, .2, .1)
 
 
-        self.x_view = VTKResliceWidget(self.reader, 'x', self.frame)
-        self.y_view = VTKResliceWidget(self.reader, 'y', self.frame)
-        self.z_view = VTKResliceWidget(self.reader, 'z', self.frame)
+        self.x_view = VTKResliceWidget(self.reader, 'x', self.frame,
+                                       number_of_threads)
+        self.y_view = VTKResliceWidget(self.reader, 'y', self.frame,
+                                       number_of_threads)
+        self.z_view = VTKResliceWidget(self.reader, 'z', self.frame,
+                                       number_of_threads)
 
         self.layout.addWidget(self.x_view, 0, 0)
         self.layout.addWidget(self.y_view, 0, 1)
@@ -262,29 +289,39 @@ class MouseWheelSliceViewer(VTKSliceViewer):
     slice_viewer.start()
     qApp.exec_()
 
+    The 3D view is re-rendered whenever a slice moves, rather than on
+    a timer, so update_rate is deprecated and has no effect.
     """
 
-    def __init__(self, input_data):
+    def __init__(self, input_data, number_of_threads=1):
 
-        super().__init__(input_data)
+        super().__init__(input_data, number_of_threads)
+        self._update_rate = 20
 
-        self.x_view.set_mouse_wheel_callbacks()
-        self.y_view.set_mouse_wheel_callbacks()
-        self.z_view.set_mouse_wheel_callbacks()
+        # Re-render the 3D view only when a slice actually moves.
+        self.x_view.set_mouse_wheel_callbacks(self.update_fourth_panel)
+        self.y_view.set_mouse_wheel_callbacks(self.update_fourth_panel)
+        self.z_view.set_mouse_wheel_callbacks(self.update_fourth_panel)
 
-        self.update_rate = 20
+    @property
+    def update_rate(self):
+        """ Deprecated, the 3D view no longer updates on a timer. """
+        return self._update_rate
+
+    @update_rate.setter
+    def update_rate(self, update_rate):
+        warnings.warn("MouseWheelSliceViewer.update_rate has no effect, "
+                      "the 3D view is updated when a slice moves.",
+                      DeprecationWarning, stacklevel=2)
+        self._update_rate = update_rate
 
     def update_fourth_panel(self):
         """ Update 3D view. """
         self.fourth_panel.GetRenderWindow().Render()
 
     def start(self):
-        #pylint:disable=attribute-defined-outside-init, no-member
-        """ Start a timer which will update the 3D view. """
-
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_fourth_panel)
-        self.timer.start(1000.0 / self.update_rate)
+        """ Show the viewer. The 3D view is updated whenever
+        a slice is moved with the mouse wheel. """
 
         self.show()
         self.reset_slice_positions()
@@ -297,6 +334,8 @@ class TrackedSliceViewer(VTKSliceViewer):
     :param input_data: Path to file/folder containing volume data
     :param tracker: scikit-surgery tracker object,
                     used to control slice positions.
+    :param number_of_threads: number of threads used by each slice
+        view's VTK imaging filters, see VTKResliceWidget.
 
     Example usage:
 
@@ -309,33 +348,130 @@ class TrackedSliceViewer(VTKSliceViewer):
     qApp.exec_()
 
     """
-    def __init__(self, input_data, tracker):
+    # Emitted by the polling thread when new tracking data arrives.
+    # Being emitted from another thread, it is queued to the Qt event loop.
+    tracking_data_ready = Signal()
+
+    def __init__(self, input_data, tracker, number_of_threads=1):
 
-        super().__init__(input_data)
+        super().__init__(input_data, number_of_threads)
         self.tracker = tracker
         self.update_rate = 20
 
+        # How long stop() waits for the polling thread to finish. The
+        # thread is a daemon, so one stuck in the tracker can't block exit.
+        self.stop_timeout = 1.0
+
+        # Latest tracking data, written by the polling thread and read by
+        # update_position on the Qt thread, so a slow tracker doesn't
+        # stall rendering.
+        self.latest_tracking_data = None
+        self.update_pending = False
+        self.tracking_lock = threading.Lock()
+        self.stop_polling = threading.Event()
+        self.polling_thread = None
+        self.last_position = None
+
+        self.tracking_data_ready.connect(self.update_position)
+
+    def poll_tracker(self):
+        """ Query the tracker update_rate times a second, storing the
+        latest result, and signal that it is ready. Only one update is
+        queued at once, so a fast tracker can't flood the event loop.
+        Errors from the tracker are logged and polling carries on.
+        Runs on a background thread, see start(). """
+        # start() makes a new event for each thread, so keep hold of ours.
+        stop_polling = self.stop_polling
+        while not stop_polling.is_set():
+            next_poll = time.monotonic() + 1.0 / self.update_rate
+            try:
+                _, _, _, tracking_data, _ = self.tracker.get_frame()
+            #pylint:disable=broad-except
+            except Exception:
+                LOGGER.exception("Failed to get tracking data.")
+            else:
+                # Don't signal for data that arrived after stop().
+                if stop_polling.is_set():
+                    break
+                with self.tracking_lock:
+                    self.latest_tracking_data = tracking_data
+                    already_pending = self.update_pending
+                    self.update_pending = True
+                if not already_pending:
+                    self.tracking_data_ready.emit()
+            stop_polling.wait(max(0.0, next_poll - time.monotonic()))
+
     def update_position(self):
         """ Get position from tracker and use this
-        to set slice positions. """
-        _, _, _, tracking_data, _ = self.tracker.get_frame()
+        to set slice positions. If the polling thread is running,
+        the most recent tracking data is used, otherwise the
+        tracker is queried directly. """
+        if self.polling_thread is not None and self.polling_thread.is_alive():
+            with self.tracking_lock:
+                tracking_data = self.latest_tracking_data
+                self.update_pending = False
+        else:
+            _, _, _, tracking_data, _ = self.tracker.get_frame()
 
         if tracking_data is not None:
             x, y, z = tracking_data[0][0][3], \
                       tracking_data[0][1][3], \
                       tracking_data[0][2][3]
 
+            # Don't re-render if the tracked position hasn't moved.
+            if (x, y, z) == self.last_position:
+                return
+
             self.update_slice_positions_mm(x, y, z)
+            self.last_position = (x, y, z)
 
-    def start(self):
-        #pylint:disable=attribute-defined-outside-init, no-member
-        """Show the overlay widget and
-        set a timer running"""
+    def update_slice_positions_mm(self, x_pos, y_pos, z_pos):
+        """ Set the slice positions for each view, see
+        VTKSliceViewer. The next tracked pose is always applied. """
+        self.last_position = None
+        super().update_slice_positions_mm(x_pos, y_pos, z_pos)
+
+    def update_slice_positions_pixels(self, x_pos, y_pos, z_pos):
+        """ Set the slice positions for each view, see
+        VTKSliceViewer. The next tracked pose is always applied. """
+        self.last_position = None
+        super().update_slice_positions_pixels(x_pos, y_pos, z_pos)
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_position)
-        self.timer.start(1000.0 / self.update_rate)
+    def reset_slice_positions(self):
+        """ Set slice positions to default values, see
+        VTKSliceViewer. The next tracked pose is always applied. """
+        self.last_position = None
+        super().reset_slice_positions()
+
+    def start(self):
+        """Show the overlay widget and start polling the tracker.
+        Slice positions are updated as tracking data arrives.
+        If already polling, the old thread is stopped first."""
+        self.stop()
 
         self.show()
 
         self.reset_slice_positions()
+
+        self.stop_polling = threading.Event()
+        self.update_pending = False
+        self.polling_thread = threading.Thread(target=self.poll_tracker,
+                                               daemon=True)
+        self.polling_thread.start()
+
+    def stop(self):
+        """ Stop the tracker polling thread, waiting at most
+        stop_timeout seconds for it to finish. """
+        self.stop_polling.set()
+        if self.polling_thread is not None:
+            self.polling_thread.join(timeout=self.stop_timeout)
+            if self.polling_thread.is_alive():
+                LOGGER.warning("Tracker polling thread did not stop "
+                               "within %s seconds.", self.stop_timeout)
+            self.polling_thread = None
+
+    def closeEvent(self, event):
+        #pylint:disable=invalid-name
+        """ Stop polling the tracker when the window is closed. """
+        self.stop()
+        super().closeEvent(event)
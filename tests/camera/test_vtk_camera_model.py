@@ -34,6 +34,50 @@ def test_create_vtk_matrix_4x4_from_numpy():
             assert vtk_matrix.GetElement(i, j) == array[i, j]
 
 
+def test_compute_right_camera_pose():
+    left_camera_to_world = mu.create_matrix_from_list([10, 20, 30, 5, -4, 3])
+    left_to_right = mu.create_matrix_from_list([1, 2, 3, -60, 0.5, 1])
+    right_camera_to_world = cam.compute_right_camera_pose(left_camera_to_world,
+                                                          left_to_right)
+    expected = np.linalg.inv(
+        left_to_right @ np.linalg.inv(left_camera_to_world))
+    assert np.allclose(right_camera_to_world, expected)
+
+
+def test_set_camera_intrinsics_matches_opengl_matrix():
+    renderer = vtk.vtkRenderer()
+    camera = renderer.GetActiveCamera()
+    opengl_mat, vtk_mat = cam.set_camera_intrinsics(renderer, camera,
+                                                    1920, 1080,
+                                                    1000, 1010, 900, 500,
+                                                    1, 1000)
+    assert np.allclose(mu.create_numpy_matrix_from_vtk(opengl_mat),
+                       mu.create_numpy_matrix_from_vtk(vtk_mat))
+
+
+
+def test_set_camera_intrinsics_leaves_user_transform_alone():
+    renderer = vtk.vtkRenderer()
+    camera = renderer.GetActiveCamera()
+
+    # A transform the caller owns, and may be using elsewhere.
+    user_transform = vtk.vtkTransform()
+    user_transform.Translate(5, 6, 7)
+    camera.SetUserTransform(user_transform)
+    expected = mu.create_numpy_matrix_from_vtk(user_transform.GetMatrix())
+
+    opengl_mat, vtk_mat = cam.set_camera_intrinsics(renderer, camera,
+                                                    1920, 1080,
+                                                    1000, 1010, 900, 500,
+                                                    1, 1000)
+    assert np.allclose(mu.create_numpy_matrix_from_vtk(opengl_mat),
+                       mu.create_numpy_matrix_from_vtk(vtk_mat))
+    assert camera.GetUserTransform() is not user_transform
+    assert np.allclose(
+        mu.create_numpy_matrix_from_vtk(user_transform.GetMatrix()),
+        expected)
+
+
 def test_set_pose_identity_should_give_origin():
     np_matrix = np.eye(4)
     vtk_matrix = mu.create_vtk_matrix_from_numpy(np_matrix)
@@ -1,6 +1,8 @@
 import os
 
 import numpy as np
+import pytest
+import vtk
 from vtk.util import numpy_support
 
 from sksurgeryvtk.models import voxelise
@@ -311,6 +313,148 @@ def test_entire_workflow():
     assert numpy_data.shape == (2582, 3)
     assert np.allclose(mean_values, expected_mean)
 
+# The tests below check the helper functions directly on small synthetic
+# data, so they don't depend on voxelise() running end to end.
+def _grid_from_points(points):
+    grid = vtk.vtkStructuredGrid()
+    grid.SetDimensions(len(points), 1, 1)
+    vtk_points = vtk.vtkPoints()
+    vtk_points.SetData(numpy_support.numpy_to_vtk(
+        np.asarray(points, dtype=np.float64), deep=1))
+    grid.SetPoints(vtk_points)
+    return grid
+
+
+def test_create_grid_points():
+    total_size = 2.0
+    grid_elements = 4
+    grid = voxelise.createGrid(total_size, grid_elements)
+
+    points = numpy_support.vtk_to_numpy(grid.GetPoints().GetData())
+    assert points.dtype == np.float32
+
+    # x varies fastest, then y, then z.
+    start = -total_size / 2
+    d = total_size / (grid_elements - 1)
+    expected = [[start + d * k, start + d * j, start + d * i]
+                for i in range(grid_elements)
+                for j in range(grid_elements)
+                for k in range(grid_elements)]
+    assert points.shape == (grid_elements**3, 3)
+    assert np.allclose(points, expected)
+
+
+def _cube_surface():
+    """ Closed, triangulated unit cube, centred on the origin. """
+    cube = vtk.vtkCubeSource()
+    # vtkCubeSource repeats the corners for each face, merge them so
+    # vtkSelectEnclosedPoints sees a closed surface.
+    clean = vtk.vtkCleanPolyData()
+    clean.SetInputConnection(cube.GetOutputPort())
+    triangles = vtk.vtkTriangleFilter()
+    triangles.SetInputConnection(clean.GetOutputPort())
+    triangles.Update()
+    return triangles.GetOutput()
+
+
+def _cube_distances(points):
+    """ Analytic unsigned distance from points to the unit cube surface. """
+    offset = np.abs(points) - 0.5
+    outside = np.linalg.norm(np.maximum(offset, 0), axis=1)
+    inside = -np.max(offset, axis=1)
+    return np.where(np.all(offset < 0, axis=1), inside, outside)
+
+
+def test_distance_field_unsigned_and_signed():
+    # No grid point lies on the surface of the cube.
+    grid = voxelise.createGrid(2.0, 4)
+    points = numpy_support.vtk_to_numpy(grid.GetPoints().GetData())
+    expected = _cube_distances(points.astype(np.float64))
+    is_inside = np.all(np.abs(points) < 0.5, axis=1)
+    assert np.count_nonzero(is_inside) == 8
+
+    voxelise.distanceField(_cube_surface(), grid, "unsigned")
+    voxelise.distanceField(_cube_surface(), grid, "signed", signed=True)
+
+    unsigned = numpy_support.vtk_to_numpy(
+        grid.GetPointData().GetArray("unsigned"))
+    signed = numpy_support.vtk_to_numpy(
+        grid.GetPointData().GetArray("signed"))
+
+    assert np.allclose(unsigned, expected, atol=1e-6)
+    assert np.allclose(signed[~is_inside], expected[~is_inside], atol=1e-6)
+    assert np.allclose(signed[is_inside], -expected[is_inside], atol=1e-6)
+
+
+def test_distance_field_from_cloud():
+    rng = np.random.default_rng(0)
+    cloud_points = rng.uniform(-1, 1, (50, 3))
+    cloud = vtk.vtkPolyData()
+    vtk_points = vtk.vtkPoints()
+    vtk_points.SetData(numpy_support.numpy_to_vtk(cloud_points, deep=1))
+    cloud.SetPoints(vtk_points)
+
+    grid = voxelise.createGrid(2.0, 5)
+    voxelise.distanceFieldFromCloud(cloud, grid, "cloud")
+
+    points = numpy_support.vtk_to_numpy(grid.GetPoints().GetData())
+    differences = points[:, np.newaxis, :] - cloud_points[np.newaxis, :, :]
+    expected = np.min(np.linalg.norm(differences, axis=2), axis=1)
+
+    distances = numpy_support.vtk_to_numpy(
+        grid.GetPointData().GetArray("cloud"))
+    assert np.allclose(distances, expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.uint8])
+def test_apply_transformation(dtype):
+    vectors = (np.arange(30).reshape(10, 3) * 3 + 1).astype(dtype)
+    grid = _grid_from_points(np.zeros((10, 3)))
+    vtk_vectors = numpy_support.numpy_to_vtk(vectors, deep=1)
+    vtk_vectors.SetName("vectors")
+    grid.GetPointData().AddArray(vtk_vectors)
+    scalars = numpy_support.numpy_to_vtk(np.arange(10.0), deep=1)
+    scalars.SetName("scalars")
+    grid.GetPointData().AddArray(scalars)
+
+    # Vectors ignore the translation, and the scale keeps uint8 in range.
+    transform = vtk.vtkTransform()
+    transform.Translate(10, 20, 30)
+    transform.Scale(1.5, 2.0, 0.5)
+    voxelise.applyTransformation(grid, transform)
+
+    result = numpy_support.vtk_to_numpy(
+        grid.GetPointData().GetArray("vectors"))
+    expected = (vectors.astype(np.float64) * [1.5, 2.0, 0.5]).astype(dtype)
+    assert result.dtype == dtype
+    assert np.allclose(result, expected)
+
+    # Arrays without 3 components are left alone.
+    assert np.array_equal(
+        numpy_support.vtk_to_numpy(grid.GetPointData().GetArray("scalars")),
+        np.arange(10.0))
+
+
+def test_store_and_load_transformation_matrix():
+    transform = vtk.vtkTransform()
+    transform.Translate(1, 2, 3)
+    transform.RotateZ(30)
+    transform.Scale(2, 3, 4)
+    grid = voxelise.createGrid(1.0, 2)
+    voxelise.storeTransformationMatrix(grid, transform)
+
+    loaded = voxelise.loadTransformationMatrix(grid)
+    for row in range(4):
+        for col in range(4):
+            assert loaded.GetMatrix().GetElement(row, col) == \
+                pytest.approx(transform.GetMatrix().GetElement(row, col))
+
+
+def test_load_transformation_matrix_missing():
+    with pytest.raises(IOError):
+        voxelise.loadTransformationMatrix(voxelise.createGrid(1.0, 2))
+
+
 # class LoadDisplacmentFromFile:
 
 #     def get_displacement(self, grid):
@@ -2,6 +2,7 @@
 
 
 import os
+import shutil
 import sys
 
 import cv2
@@ -37,6 +38,14 @@ def test_valid_ply_results_in_vtkplyreader():
     assert isinstance(model.reader, vtk.vtkPLYReader)
 
 
+def test_upper_case_extension_results_in_vtkstlreader(tmp_path):
+    input_file = str(tmp_path / 'Fiducial.STL')
+    shutil.copyfile('tests/data/models/Fiducial.stl', input_file)
+    model = VTKSurfaceModel(input_file, colors.red)
+    assert isinstance(model.reader, vtk.vtkSTLReader)
+    assert model.source.GetNumberOfPoints() > 0
+
+
 def test_invalid_because_model_file_format():
     input_file = 'tox.ini'
     with pytest.raises(ValueError):
@@ -244,6 +253,14 @@ def test_valid_set_texture_with_jpg_format(vtk_overlay_with_gradient_image):
     # app.exec()
 
 
+def test_upper_case_texture_extension_results_in_vtkjpegreader(tmp_path):
+    model = VTKSurfaceModel('tests/data/models/liver.ply', colors.red)
+    texture_file = str(tmp_path / 'texture.JPG')
+    cv2.imwrite(texture_file, np.zeros((8, 8, 3), dtype=np.uint8))
+    model.set_texture(texture_file)
+    assert isinstance(model.texture_reader, vtk.vtkJPEGReader)
+
+
 def test_invalid_set_texture_because_texture_file_format():
     input_file = 'tests/data/models/liver.ply'
     model = VTKSurfaceModel(input_file, colors.red)
@@ -355,3 +372,21 @@ def test_get_outline_actor():
 
     model.set_outline(False)
     assert model.get_outline_actor(active_camera=None) is None
+
+
+def test_get_outline_actor_reuses_pipeline():
+    """Calling get_outline_actor again shouldn't rebuild the silhouette"""
+    input_file = 'tests/data/models/liver.ply'
+    model = VTKSurfaceModel(input_file, colors.red, visibility=True,
+                            opacity=1.0, pickable=True,
+                            outline=True)
+    camera = vtk.vtkCamera()
+    outline = model.get_outline_actor(active_camera=camera)
+    mapper = outline.GetMapper()
+    silhouette = model.outline_actor.silhouette
+
+    other_camera = vtk.vtkCamera()
+    outline = model.get_outline_actor(active_camera=other_camera)
+    assert outline.GetMapper() is mapper
+    assert model.outline_actor.silhouette is silhouette
+    assert silhouette.GetCamera() is other_camera
@@ -6,7 +6,8 @@ import platform
 import pytest
 import six
 
-from sksurgeryvtk.models.vtk_surface_model_directory_loader import VTKSurfaceModelDirectoryLoader
+from sksurgeryvtk.models.vtk_surface_model_directory_loader import VTKSurfaceModelDirectoryLoader, \
+    DEFAULT_COLOURS
 
 
 @pytest.fixture(scope="function")
@@ -67,8 +68,8 @@ def test_valid_dir_with_default_colours():
     dir_name = 'tests/data/models/Kidney'
     loader = VTKSurfaceModelDirectoryLoader(dir_name)
     assert len(loader.models) == 2
-    assert loader.models[0].get_colour() == loader.colours[str(0)]
-    assert loader.models[1].get_colour() == loader.colours[str(1)]
+    assert loader.models[0].get_colour() == DEFAULT_COLOURS[0]
+    assert loader.models[1].get_colour() == DEFAULT_COLOURS[1]
 
 
 def test_valid_dir_with_colours_from_file_from_issue_4():
@@ -101,3 +102,15 @@ def test_valid_dir_with_colours_model_file_doesnt_exist():
     dir_name = 'tests/data/models/bad_colours'
     with pytest.raises(FileNotFoundError):
         loader = VTKSurfaceModelDirectoryLoader(dir_name)
+
+
+def test_more_models_than_default_colours(tmp_path):
+    with open('tests/data/models/Prostate.vtk', 'rb') as model_file:
+        model_data = model_file.read()
+    for i in range(12):
+        (tmp_path / f'model_{i:02d}.vtk').write_bytes(model_data)
+
+    loader = VTKSurfaceModelDirectoryLoader(str(tmp_path))
+    assert len(loader.models) == 12
+    assert loader.models[10].get_colour() == DEFAULT_COLOURS[0]
+    assert loader.models[11].get_colour() == DEFAULT_COLOURS[1]
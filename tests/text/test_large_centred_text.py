@@ -21,4 +21,21 @@ def test_position_correct(setup_vtk_overlay_window):
 
     # vtk_overlay_window.show()
     # app.exec()
-    # vtk_overlay_window.close()
\ No newline at end of file
+    # vtk_overlay_window.close()
+
+def test_unchanged_window_size_skips_update(setup_vtk_overlay_window):
+    """
+    Repeated callbacks with the same window size shouldn't reposition text.
+    """
+    vtk_overlay_window, _, _ = setup_vtk_overlay_window
+
+    vtk_text = VTKLargeTextCentreOfScreen("Some text")
+    vtk_text.set_parent_window(vtk_overlay_window)
+
+    window_size = vtk_overlay_window._RenderWindow.GetSize()
+    assert vtk_text.window_size == tuple(window_size)
+
+    vtk_text.set_text_position(10, 20)
+    vtk_text.calculate_text_size(None, None)
+
+    assert vtk_text.text_actor.GetPosition() == (10, 20)
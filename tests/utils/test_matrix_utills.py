@@ -32,6 +32,18 @@ def test_numpy_to_vtk():
     assert id(numpy_array) != id(converted_back)
 
 
+def test_vtk_to_numpy_is_row_major():
+    vtk_matrix = vtk.vtkMatrix4x4()
+    vtk_matrix.SetElement(0, 3, 5)
+    vtk_matrix.SetElement(2, 1, 7)
+    numpy_matrix = mu.create_numpy_matrix_from_vtk(vtk_matrix)
+    for i in range(4):
+        for j in range(4):
+            assert numpy_matrix[i, j] == vtk_matrix.GetElement(i, j)
+    numpy_matrix[0, 0] = 2
+    assert vtk_matrix.GetElement(0, 0) == 1
+
+
 def test_invalid_because_not_vtk_matrix():
     with pytest.raises(TypeError):
         _ = mu.create_numpy_matrix_from_vtk("banana")
@@ -101,3 +101,12 @@ def test_project_facing_points_valid_example_synthetic_data():
                                                 world_to_camera,
                                                 camera_matrix)
     assert projected_points.shape[0] == 1
+
+
+def test_compute_rms_error_invalid_as_lengths_differ():
+    with pytest.raises(ValueError):
+        pu.compute_rms_error(np.zeros((3, 3)), np.zeros((2, 2)),
+                             None, 1, 1, 100)
+    with pytest.raises(ValueError):
+        pu.compute_rms_error(np.zeros((2, 3)), np.zeros((3, 2)),
+                             None, 1, 1, 100)
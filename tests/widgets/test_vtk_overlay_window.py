@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import cv2
 import numpy as np
 import pytest
+import vtk
+from vtk.util.numpy_support import vtk_to_numpy
 from vtkmodules.vtkCommonColor import vtkNamedColors
 from vtkmodules.vtkFiltersSources import vtkConeSource
 from vtkmodules.vtkRenderingCore import (
@@ -13,6 +16,7 @@ from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout
 from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 import sksurgeryvtk.models.vtk_point_model as pm
 import sksurgeryvtk.models.vtk_surface_model as sm
+from sksurgeryvtk.widgets.vtk_overlay_window import VTKOverlayWindow
 
 
 def test_vtk_render_window_settings(setup_vtk_overlay_window):
@@ -41,6 +45,31 @@ def test_vtk_foreground_render_settings(setup_vtk_overlay_window):
     layer = widget.get_foreground_renderer().GetLayer()
     assert widget.get_foreground_renderer().GetLayer() == 1
     assert widget.get_foreground_renderer().GetUseDepthPeeling()
+    assert widget.get_foreground_renderer().GetMaximumNumberOfPeels() == 100
+    widget.close()
+
+
+def test_vtk_foreground_render_max_peels(setup_vtk_err):
+    _vtk_std_err, _pyside_qt_app = setup_vtk_err
+    widget = VTKOverlayWindow(offscreen=False, init_widget=False,
+                              max_number_of_peels=8)
+
+    assert widget.get_foreground_renderer(1).GetMaximumNumberOfPeels() == 8
+    assert widget.get_foreground_renderer(3).GetMaximumNumberOfPeels() == 8
+    widget.close()
+
+
+def test_interactor_style(setup_vtk_err):
+    _vtk_std_err, _pyside_qt_app = setup_vtk_err
+    widget = VTKOverlayWindow(offscreen=False, init_widget=False)
+    assert isinstance(widget.GetInteractorStyle(),
+                      vtk.vtkInteractorStyleTrackballCamera)
+    widget.close()
+
+    style = vtk.vtkInteractorStyleUser()
+    widget = VTKOverlayWindow(offscreen=False, init_widget=False,
+                              interactor_style=style)
+    assert widget.GetInteractorStyle() is style
     widget.close()
 
 
@@ -74,6 +103,107 @@ def test_frame_pixels(setup_vtk_overlay_window):
     widget.close()
 
 
+def test_frame_buffer_reused_for_same_size(setup_vtk_overlay_window):
+    widget, _vtk_std_err, _pyside_qt_app = setup_vtk_overlay_window
+
+    image = np.zeros((100, 120, 3), dtype=np.uint8)
+    widget.set_video_image(image)
+    first_frame = widget.rgb_frame
+
+    image[:, :, 0] = 10
+    widget.set_video_image(image)
+    assert widget.rgb_frame is first_frame
+    assert np.array_equal(widget.rgb_frame[0, 0, :], [0, 0, 10])
+    imported = vtk_to_numpy(
+        widget.rgb_image_importer.GetOutput().GetPointData().GetScalars())
+    assert np.array_equal(imported[0], [0, 0, 10])
+
+    widget.set_video_image(np.zeros((50, 60, 3), dtype=np.uint8))
+    assert widget.rgb_frame.shape == (50, 60, 3)
+    assert widget.rgb_image_importer.GetDataExtent() == (0, 59, 0, 49, 0, 2)
+    assert widget.rgb_image_importer.GetWholeExtent() == (0, 59, 0, 49, 0, 2)
+    widget.close()
+
+
+def test_frame_buffer_is_c_ordered(setup_vtk_overlay_window):
+    widget, _vtk_std_err, _pyside_qt_app = setup_vtk_overlay_window
+
+    image = np.asfortranarray(
+        np.random.randint(0, 255, (30, 40, 3), dtype=np.uint8))
+    widget.set_video_image(image)
+
+    assert widget.rgb_frame.flags['C_CONTIGUOUS']
+    imported = vtk_to_numpy(
+        widget.rgb_image_importer.GetOutput().GetPointData().GetScalars())
+    first_slice = imported[0:30 * 40].reshape(30, 40, 3)
+    assert np.array_equal(first_slice, image[:, :, ::-1])
+    widget.close()
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.float32])
+def test_invalid_video_image_dtype(setup_vtk_overlay_window, dtype):
+    widget, _vtk_std_err, _pyside_qt_app = setup_vtk_overlay_window
+
+    # The importers read unsigned char, so other types would be garbage.
+    with pytest.raises(ValueError):
+        widget.set_video_image(np.zeros((30, 40, 3), dtype=dtype))
+    assert widget.rgb_frame.dtype == np.uint8
+    widget.close()
+
+
+def test_convert_scene_reuses_exporter(vtk_overlay_with_gradient_image):
+    image, widget, _vtk_std_err, _pyside_qt_app = vtk_overlay_with_gradient_image
+
+    widget.resize(image.shape[1], image.shape[0])
+    widget.show()
+    widget.Initialize()
+    widget.Start()
+
+    first = widget.convert_scene_to_numpy_array()
+    exporter = widget.vtk_win_to_img_filter
+
+    second = widget.convert_scene_to_numpy_array()
+    assert widget.vtk_win_to_img_filter is exporter
+    assert second.shape == first.shape
+    assert second is not first
+    widget.close()
+
+
+def test_save_scene_to_file_is_bgr(vtk_overlay_with_gradient_image):
+    image, widget, _vtk_std_err, _pyside_qt_app = vtk_overlay_with_gradient_image
+
+    widget.resize(image.shape[1], image.shape[0])
+    widget.show()
+    widget.Initialize()
+    widget.Start()
+
+    widget.save_scene_to_file('tests/output/test_save_scene_to_file.png')
+    saved = cv2.imread('tests/output/test_save_scene_to_file.png')
+
+    # VTK's image is RGB and bottom-up, the saved file should be BGR, top-down.
+    width, height, _ = widget.vtk_image.GetDimensions()
+    rgb = vtk_to_numpy(widget.vtk_array).reshape(height, width, 3)
+    expected = cv2.cvtColor(cv2.flip(rgb, flipCode=0), cv2.COLOR_RGB2BGR)
+    assert np.array_equal(saved, expected)
+    widget.close()
+
+
+def test_camera_state_round_trip(setup_vtk_overlay_window):
+    widget, _vtk_std_err, _pyside_qt_app = setup_vtk_overlay_window
+
+    state = widget.get_camera_state()
+    state["Position"] = (1.0, 2.0, 3.0)
+    state["ViewAngle"] = 45.0
+    state["ParallelProjection"] = 1
+
+    widget.set_camera_state(state)
+    new_state = widget.get_camera_state()
+    assert new_state["Position"] == (1.0, 2.0, 3.0)
+    assert new_state["ViewAngle"] == 45.0
+    assert new_state["ParallelProjection"] == 1
+    widget.close()
+
+
 def test_basic_pyside_vtk_pipeline():
     """
     Local test of a basic vtk pipeline with pyside
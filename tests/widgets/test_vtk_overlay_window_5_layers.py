@@ -254,4 +254,31 @@ def test_overlay_window_combined_ar_look(setup_vtk_overlay_window_video_only_lay
 
     # You don't really want this in a unit test, :-)
     # otherwise you can't exit. It's kept here for interactive testing.
-    #app.exec()
\ No newline at end of file
+    #app.exec()
+
+def test_layer_2_frame_buffer_reused(setup_vtk_overlay_window_video_only_layer_2):
+    """
+    The RGBA buffer for layer 2 is only reallocated when the image size changes.
+    """
+    widget, _vtk_std_err, _app = setup_vtk_overlay_window_video_only_layer_2
+
+    image = np.zeros((100, 120, 3), dtype=np.uint8)
+    widget.set_video_image(image)
+    first_frame = widget.rgba_frame
+    assert np.all(first_frame[:, :, 3] == 255)
+
+    image[:, :, 0] = 10
+    widget.set_video_image(image)
+    assert widget.rgba_frame is first_frame
+    assert np.array_equal(widget.rgba_frame[0, 0, :], [0, 0, 10, 255])
+
+    mask = np.zeros((100, 120, 1), dtype=np.uint8)
+    widget.set_video_mask(mask)
+    widget.set_video_image(image)
+    assert widget.rgba_frame is first_frame
+    assert np.all(widget.rgba_frame[:, :, 3] == 0)
+
+    widget.set_video_mask(np.zeros((50, 60, 1), dtype=np.uint8))
+    widget.set_video_image(np.zeros((50, 60, 3), dtype=np.uint8))
+    assert widget.rgba_frame.shape == (50, 60, 4)
+    widget.close()
@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import logging
+import threading
+
+import numpy as np
+import pytest
+
 from sksurgeryvtk.widgets import vtk_reslice_widget
 
 
@@ -19,3 +25,243 @@ def test_mouse_scroll_slice_viewer(qtbot):
     qtbot.addWidget(reslice)
 
     reslice.update_slice_positions_pixels(1, 1, 1)
+
+
+def test_reslice_widget_number_of_threads(qtbot):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    reslice = vtk_reslice_widget.VTKSliceViewer(dicom_path)
+
+    qtbot.addWidget(reslice)
+
+    assert reslice.x_view.colours.GetNumberOfThreads() == 1
+
+
+def test_slice_viewer_passes_number_of_threads(qtbot):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    reslice = vtk_reslice_widget.MouseWheelSliceViewer(dicom_path,
+                                                       number_of_threads=2)
+
+    qtbot.addWidget(reslice)
+
+    for view in [reslice.x_view, reslice.y_view, reslice.z_view]:
+        assert view.number_of_threads == 2
+        assert view.colours.GetNumberOfThreads() == 2
+
+
+class FakeTracker:
+    """ Returns a fixed pose, in the same format as sksurgery trackers. """
+    def get_frame(self):
+        tracking = np.eye(4)
+        tracking[0:3, 3] = [2, 3, 4]
+        return None, None, None, [tracking], None
+
+
+def test_tracked_slice_viewer(qtbot):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    reslice = vtk_reslice_widget.TrackedSliceViewer(dicom_path, FakeTracker())
+
+    qtbot.addWidget(reslice)
+
+    expected_z = int(4 / reslice.z_view.z_spacing)
+
+    # The polling thread signals the Qt thread to move the slices.
+    reslice.start()
+    qtbot.waitUntil(lambda: reslice.last_position is not None)
+    reslice.stop()
+
+    assert not reslice.polling_thread
+    assert reslice.last_position == (2, 3, 4)
+    assert reslice.z_view.get_slice_position() == expected_z
+
+
+def test_tracked_slice_viewer_start_twice(qtbot):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    reslice = vtk_reslice_widget.TrackedSliceViewer(dicom_path, FakeTracker())
+
+    qtbot.addWidget(reslice)
+
+    reslice.start()
+    first_thread = reslice.polling_thread
+    reslice.start()
+    second_thread = reslice.polling_thread
+
+    # The second start() stops the first thread, rather than orphaning it.
+    assert second_thread is not first_thread
+    assert not first_thread.is_alive()
+    assert second_thread.is_alive()
+
+    reslice.stop()
+    assert not second_thread.is_alive()
+
+
+class FlakyTracker(FakeTracker):
+    """ Raises on the first call, then returns the fixed pose. """
+    def __init__(self):
+        self.calls = 0
+
+    def get_frame(self):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("Tracker not ready")
+        return super().get_frame()
+
+
+class BlockedTracker(FakeTracker):
+    """ Blocks in get_frame until released. """
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def get_frame(self):
+        self.entered.set()
+        self.release.wait()
+        return super().get_frame()
+
+
+class RecordingEvent:
+    """ Stands in for the stop event, recording how long the polling
+    loop waits, and stopping it after a number of polls. """
+    def __init__(self, polls):
+        self.polls = polls
+        self.timeouts = []
+
+    def is_set(self):
+        return len(self.timeouts) >= self.polls
+
+    def wait(self, timeout):
+        self.timeouts.append(timeout)
+
+    def set(self):
+        """ Called by stop() when the widget is closed. """
+
+
+def test_poll_tracker_survives_tracker_errors(qtbot, caplog):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    tracker = FlakyTracker()
+    reslice = vtk_reslice_widget.TrackedSliceViewer(dicom_path, tracker)
+
+    qtbot.addWidget(reslice)
+
+    # Run the loop on this thread, for two polls. Being on the Qt
+    # thread, the signal would call update_position straight away.
+    reslice.tracking_data_ready.disconnect(reslice.update_position)
+    reslice.stop_polling = RecordingEvent(polls=2)
+    with caplog.at_level(logging.ERROR):
+        reslice.poll_tracker()
+
+    assert tracker.calls == 2
+    assert "Failed to get tracking data." in caplog.text
+    assert reslice.latest_tracking_data[0][2][3] == 4
+    assert reslice.update_pending
+
+
+def test_poll_tracker_is_paced_by_update_rate(qtbot):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    reslice = vtk_reslice_widget.TrackedSliceViewer(dicom_path, FakeTracker())
+
+    qtbot.addWidget(reslice)
+
+    reslice.tracking_data_ready.disconnect(reslice.update_position)
+    reslice.update_rate = 10
+    reslice.stop_polling = RecordingEvent(polls=3)
+    reslice.poll_tracker()
+
+    assert len(reslice.stop_polling.timeouts) == 3
+    for timeout in reslice.stop_polling.timeouts:
+        assert 0 < timeout <= 0.1
+
+
+def test_stop_does_not_hang_on_blocked_tracker(qtbot, caplog):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    tracker = BlockedTracker()
+    reslice = vtk_reslice_widget.TrackedSliceViewer(dicom_path, tracker)
+
+    qtbot.addWidget(reslice)
+
+    reslice.stop_timeout = 0.1
+    reslice.start()
+    assert tracker.entered.wait(timeout=5)
+    polling_thread = reslice.polling_thread
+
+    with caplog.at_level(logging.WARNING):
+        reslice.stop()
+
+    assert reslice.polling_thread is None
+    assert "did not stop" in caplog.text
+
+    # Once the tracker returns, the old thread exits without
+    # passing on the late tracking data.
+    tracker.release.set()
+    polling_thread.join(timeout=5)
+    assert not polling_thread.is_alive()
+    assert reslice.latest_tracking_data is None
+    assert not reslice.update_pending
+
+
+def test_tracked_slice_viewer_skips_unchanged_pose(qtbot):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    reslice = vtk_reslice_widget.TrackedSliceViewer(dicom_path, FakeTracker())
+
+    qtbot.addWidget(reslice)
+
+    updates = []
+    reslice.update_slice_positions_mm = lambda x, y, z: updates.append((x, y, z))
+
+    reslice.update_position()
+    reslice.update_position()
+
+    assert updates == [(2, 3, 4)]
+
+
+def test_tracked_slice_viewer_reapplies_pose_after_reset(qtbot):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    reslice = vtk_reslice_widget.TrackedSliceViewer(dicom_path, FakeTracker())
+
+    qtbot.addWidget(reslice)
+
+    def slice_positions():
+        return [view.get_slice_position()
+                for view in [reslice.x_view, reslice.y_view, reslice.z_view]]
+
+    reslice.update_position()
+    tracked_positions = slice_positions()
+
+    # Moving the slices some other way means the same pose
+    # has to be applied again.
+    reslice.reset_slice_positions()
+    assert slice_positions() != tracked_positions
+    reslice.update_position()
+    assert slice_positions() == tracked_positions
+
+    reslice.update_slice_positions_pixels(1, 1, 1)
+    assert slice_positions() != tracked_positions
+    reslice.update_position()
+    assert slice_positions() == tracked_positions
+
+
+def test_mouse_wheel_updates_fourth_panel(qtbot):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    reslice = vtk_reslice_widget.MouseWheelSliceViewer(dicom_path)
+
+    qtbot.addWidget(reslice)
+
+    renders = []
+    reslice.z_view.on_slice_changed = lambda: renders.append(True)
+
+    reslice.update_slice_positions_pixels(1, 1, 1)
+    reslice.z_view.on_mouse_wheel_forward(None, None)
+
+    assert reslice.z_view.get_slice_position() == 2
+    assert renders == [True]
+
+
+def test_mouse_wheel_update_rate_is_deprecated(qtbot):
+    dicom_path = 'tests/data/dicom/LegoPhantom_10slices'
+    reslice = vtk_reslice_widget.MouseWheelSliceViewer(dicom_path)
+
+    qtbot.addWidget(reslice)
+
+    assert reslice.update_rate == 20
+    with pytest.deprecated_call():
+        reslice.update_rate = 30
+    assert reslice.update_rate == 30